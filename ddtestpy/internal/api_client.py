@@ -198,15 +198,27 @@ class APIClient:
         try:
             response, response_data = self.connector.post_json("/api/v2/ci/tests/skippable", request_data)
             skippable_items: t.Set[t.Union[SuiteRef, TestRef]] = set()
+            # The response usually lists many tests from the same few suites, so build each module and suite ref only
+            # once.
+            module_refs: t.Dict[str, ModuleRef] = {}
+            suite_refs: t.Dict[t.Tuple[str, str], SuiteRef] = {}
 
             for item in response_data["data"]:
                 if item["type"] in ("test", "suite"):
-                    module_ref = ModuleRef(item["attributes"].get("configurations", {}).get("test.bundle", EMPTY_NAME))
-                    suite_ref = SuiteRef(module_ref, item["attributes"].get("suite", EMPTY_NAME))
+                    attributes = item["attributes"]
+                    module_name = attributes.get("configurations", {}).get("test.bundle", EMPTY_NAME)
+                    suite_name = attributes.get("suite", EMPTY_NAME)
+                    suite_ref = suite_refs.get((module_name, suite_name))
+                    if suite_ref is None:
+                        module_ref = module_refs.get(module_name)
+                        if module_ref is None:
+                            module_ref = module_refs[module_name] = ModuleRef(module_name)
+                        suite_ref = suite_refs[module_name, suite_name] = SuiteRef(module_ref, suite_name)
+
                     if item["type"] == "suite" and self.itr_skipping_level == ITRSkippingLevel.SUITE:
                         skippable_items.add(suite_ref)
                     elif item["type"] == "test" and self.itr_skipping_level == ITRSkippingLevel.TEST:
-                        test_ref = TestRef(suite_ref, item["attributes"].get("name", EMPTY_NAME))
+                        test_ref = TestRef(suite_ref, attributes.get("name", EMPTY_NAME))
                         skippable_items.add(test_ref)
 
             correlation_id = response_data["meta"]["correlation_id"]
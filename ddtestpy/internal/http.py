@@ -15,6 +15,7 @@ import typing as t
 from urllib.parse import ParseResult
 from urllib.parse import urlparse
 import uuid
+import zlib
 
 from ddtestpy.internal.constants import DEFAULT_AGENT_HOSTNAME
 from ddtestpy.internal.constants import DEFAULT_AGENT_PORT
@@ -25,6 +26,7 @@ from ddtestpy.internal.utils import asbool
 
 
 DEFAULT_TIMEOUT_SECONDS = 15.0
+GZIP_COMPRESS_LEVEL = 6
 
 log = logging.getLogger(__name__)
 
@@ -205,7 +207,7 @@ class BackendConnector(threading.local):
         full_headers = self.default_headers | (headers or {})
 
         if send_gzip and self.use_gzip and data is not None:
-            data = gzip.compress(data, compresslevel=6)
+            data = gzip_compress(data)
             full_headers["Content-Encoding"] = "gzip"
 
         start_time = time.time()
@@ -269,6 +271,18 @@ class BackendConnector(threading.local):
         return self.request("POST", path=path, data=body.getvalue(), headers=headers, send_gzip=send_gzip)
 
 
+def gzip_compress(data: bytes) -> bytes:
+    """
+    Compress `data` into a gzip stream.
+
+    This produces the same kind of output as `gzip.compress()`, but in a single pass through a zlib compressor (wbits=31
+    selects the gzip container). On Python < 3.11, `gzip.compress()` goes through a `GzipFile` wrapping a `BytesIO`,
+    which is noticeably slower for the payload sizes we send on every flush.
+    """
+    compressor = zlib.compressobj(GZIP_COMPRESS_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
 @dataclass
 class FileAttachment:
     name: str
@@ -36,7 +36,7 @@ from ddtestpy.internal.test_data import TestTag
 from ddtestpy.internal.utils import TestContext
 
 
-_NODEID_REGEX = re.compile("^(((?P<module>.*)/)?(?P<suite>[^/]*?))::(?P<name>.*?)$")
+_EMPTY_SUITE_REF = SuiteRef(ModuleRef(EMPTY_NAME), EMPTY_NAME)
 DISABLED_BY_TEST_MANAGEMENT_REASON = "Flaky test is disabled by Datadog"
 SKIPPED_BY_ITR_REASON = "Skipped by Datadog Intelligent Test Runner"
 ITR_UNSKIPPABLE_REASON = "datadog_itr_unskippable"
@@ -89,20 +89,18 @@ _Location = t.Tuple[
 
 
 def nodeid_to_test_ref(nodeid: str) -> TestRef:
-    matches = _NODEID_REGEX.match(nodeid)
+    # A nodeid looks like `path/to/module/suite.py::TestClass::test_name[params]`. Everything up to the first `::` is
+    # the file path, and the test name is everything after it (parameters may contain `/` and `::` themselves).
+    path, separator, name = nodeid.partition("::")
 
-    if matches:
-        module_ref = ModuleRef(matches.group("module") or EMPTY_NAME)
-        suite_ref = SuiteRef(module_ref, matches.group("suite") or EMPTY_NAME)
-        test_ref = TestRef(suite_ref, matches.group("name"))
-        return test_ref
+    if separator:
+        module_name, _, suite_name = path.rpartition("/")
+        module_ref = ModuleRef(module_name or EMPTY_NAME)
+        suite_ref = SuiteRef(module_ref, suite_name or EMPTY_NAME)
+        return TestRef(suite_ref, name)
 
-    else:
-        # Fallback to considering the whole nodeid as the test name.
-        module_ref = ModuleRef(EMPTY_NAME)
-        suite_ref = SuiteRef(module_ref, EMPTY_NAME)
-        test_ref = TestRef(suite_ref, nodeid)
-        return test_ref
+    # Fallback to considering the whole nodeid as the test name.
+    return TestRef(_EMPTY_SUITE_REF, nodeid)
 
 
 def _get_module_path_from_item(item: pytest.Item) -> Path:
@@ -137,6 +135,7 @@ class TestOptPlugin:
         self.reports_by_nodeid: t.Dict[str, _ReportGroup] = defaultdict(lambda: {})
         self.excinfo_by_report: t.Dict[pytest.TestReport, t.Optional[pytest.ExceptionInfo[t.Any]]] = {}
         self.tests_by_nodeid: t.Dict[str, Test] = {}
+        self.test_refs_by_nodeid: t.Dict[str, TestRef] = {}
         self.is_xdist_worker = False
 
         self.manager = session_manager
@@ -185,11 +184,22 @@ class TestOptPlugin:
         tests that pytest has selection for run (eg: with the use of -k as an argument).
         """
         for item in session.items:
-            test_ref = nodeid_to_test_ref(item.nodeid)
+            test_ref = self._get_test_ref(item.nodeid)
             test_module, test_suite, test = self._discover_test(item, test_ref)
 
         self.manager.finish_collection()
 
+    def _get_test_ref(self, nodeid: str) -> TestRef:
+        """
+        Return the test ref for the given nodeid, parsing the nodeid only the first time it is seen.
+
+        Each nodeid is looked up during collection and then twice while running (as `item` and as `nextitem`). Reusing
+        the same ref object also makes the session manager's dict lookups by ref hit the identity fast path.
+        """
+        if (test_ref := self.test_refs_by_nodeid.get(nodeid)) is None:
+            test_ref = self.test_refs_by_nodeid[nodeid] = nodeid_to_test_ref(nodeid)
+        return test_ref
+
     def _discover_test(self, item: pytest.Item, test_ref: TestRef) -> t.Tuple[TestModule, TestSuite, Test]:
         """
         Return the module, suite and test objects for a given test item, creating them if necessary.
@@ -222,8 +232,8 @@ class TestOptPlugin:
     def pytest_runtest_protocol_wrapper(
         self, item: pytest.Item, nextitem: t.Optional[pytest.Item]
     ) -> t.Generator[None, None, None]:
-        test_ref = nodeid_to_test_ref(item.nodeid)
-        next_test_ref = nodeid_to_test_ref(nextitem.nodeid) if nextitem else None
+        test_ref = self._get_test_ref(item.nodeid)
+        next_test_ref = self._get_test_ref(nextitem.nodeid) if nextitem else None
 
         test_module, test_suite, test = test_items = self._discover_test(item, test_ref)
         for test_item in test_items:
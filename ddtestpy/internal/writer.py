@@ -1,7 +1,9 @@
 from abc import ABC
 from abc import abstractmethod
+from collections import deque
 import logging
 import threading
+from types import MappingProxyType
 import typing as t
 import uuid
 
@@ -22,30 +24,67 @@ log = logging.getLogger(__name__)
 
 
 class Event(dict[str, t.Any]):
-    pass
+    # Events only carry dict items; dropping the per-instance __dict__ saves memory for every buffered event.
+    __slots__ = ()
 
 
 TSerializable = t.TypeVar("TSerializable", bound=TestItem[t.Any, t.Any])
 
 EventSerializer = t.Callable[[TSerializable], Event]
 
+# Precomputed per-status values for the serializers, so they don't go through `TestStatus.value` or compare statuses
+# for every event.
+_STATUS_TO_STR: t.Dict[TestStatus, str] = {status: status.value for status in TestStatus}
+_STATUS_TO_ERROR: t.Dict[TestStatus, int] = {status: int(status == TestStatus.FAIL) for status in TestStatus}
+
 
 class BaseWriter(ABC):
     def __init__(self) -> None:
-        self.lock = threading.RLock()
-        self.should_finish = threading.Event()
+        # Only ever set once, by finish(), so a plain flag is enough; `flush_now` is what wakes the background task up.
+        self.should_finish = False
+        self.flush_now = threading.Event()
         self.flush_interval_seconds = 60
-        self.events: t.List[Event] = []
-
-    def put_event(self, event: Event) -> None:
-        # TODO: compute/estimate payload size as events are inserted, and force a push once we reach a certain size.
-        with self.lock:
-            self.events.append(event)
+        self.flush_num_events = 10_000
+        self.flush_num_bytes = 1024 * 1024
+        self.events: t.Deque[Event] = deque()
+        self.pending_bytes = 0
+        # Reused across flushes to avoid creating a new packer (and growing its internal buffer) for every payload.
+        # Packers are not thread-safe; this is fine because events are only sent from the background task.
+        self.packer = msgpack.Packer()
+
+    def put_event(self, event: Event, size: int = 0) -> None:
+        """
+        Buffer an event to be sent by the background task.
+
+        `size` is an estimate of the serialized size of the event, if the caller knows it cheaply. The background task
+        is woken up to flush early once either the number of buffered events or their estimated size reaches the
+        configured threshold, instead of waiting for the next periodic flush.
+        """
+        # deque.append() is atomic, so producers never need to take the lock.
+        self.events.append(event)
+
+        if size:
+            # Not atomic, but this is only a heuristic to trigger an early flush, so an occasional lost update is fine.
+            self.pending_bytes += size
+
+        if not self.flush_now.is_set() and (
+            len(self.events) >= self.flush_num_events or self.pending_bytes >= self.flush_num_bytes
+        ):
+            self.flush_now.set()
 
     def pop_events(self) -> t.List[Event]:
-        with self.lock:
-            events = self.events
-            self.events = []
+        # Drain the deque in place rather than swapping it for a new one: a producer that already fetched a reference
+        # to the current deque may still append to it, and that event would be lost if we dropped the old deque.
+        # deque.popleft() is atomic, so no lock is needed; if consumers race, each event is returned to only one.
+        events: t.List[Event] = []
+        self.pending_bytes = 0
+
+        try:
+            for _ in range(len(self.events)):
+                events.append(self.events.popleft())
+        except IndexError:
+            # Another consumer drained the remaining events concurrently.
+            pass
 
         return events
 
@@ -55,17 +94,19 @@ class BaseWriter(ABC):
 
     def finish(self) -> None:
         log.debug("Waiting for writer thread to finish")
-        self.should_finish.set()
+        self.should_finish = True
+        self.flush_now.set()
         self.task.join()
         log.debug("Writer thread finished")
 
     def _periodic_task(self) -> None:
         while True:
-            self.should_finish.wait(timeout=self.flush_interval_seconds)
+            self.flush_now.wait(timeout=self.flush_interval_seconds)
+            self.flush_now.clear()
             log.debug("Flushing events in background task")
             self.flush()
 
-            if self.should_finish.is_set():
+            if self.should_finish:
                 break
 
         log.debug("Exiting background task")
@@ -86,6 +127,8 @@ class TestOptWriter(BaseWriter):
     def __init__(self, connector_setup: BackendConnectorSetup) -> None:
         super().__init__()
 
+        self.max_payload_bytes = 3_000_000
+
         self.metadata: t.Dict[str, t.Dict[str, str]] = {
             "*": {
                 "language": "python",
@@ -105,29 +148,75 @@ class TestOptWriter(BaseWriter):
             },
         }
 
+        self._payload_header: t.Optional[bytes] = None
+
         self.connector = connector_setup.get_connector_for_subdomain("citestcycle-intake")
 
-        self.serializers: t.Dict[t.Type[TestItem[t.Any, t.Any]], EventSerializer[t.Any]] = {
-            TestRun: serialize_test_run,
-            TestSuite: serialize_suite,
-            TestModule: serialize_module,
-            TestSession: serialize_session,
-        }
+        self.serializers = SERIALIZERS
 
     def add_metadata(self, event_type: str, metadata: t.Dict[str, str]) -> None:
+        """
+        Add metadata to be sent in the envelope of every payload.
+
+        Metadata must only be changed through this method, so that the cached payload header is rebuilt, and only
+        before `start()`: payloads are built on the background thread, which could otherwise cache a header packed from
+        a partially updated `metadata` dict.
+        """
         self.metadata[event_type].update(metadata)
+        self._payload_header = None
+
+    def _get_payload_header(self) -> bytes:
+        """
+        Return the packed payload envelope up to (but not including) the events array header.
+
+        The metadata is the same for every payload, so it is packed once and reused until `add_metadata()` changes it.
+        """
+        if self._payload_header is None:
+            packer = self.packer
+            self._payload_header = b"".join(
+                [
+                    packer.pack_map_header(3),
+                    packer.pack("version"),
+                    packer.pack(1),
+                    packer.pack("metadata"),
+                    packer.pack(self.metadata),
+                    packer.pack("events"),
+                ]
+            )
+
+        return self._payload_header
 
     def put_item(self, item: TestItem[t.Any, t.Any]) -> None:
         event = self.serializers[type(item)](item)
         self.put_event(event)
 
     def _send_events(self, events: t.List[Event]) -> None:
-        payload = {
-            "version": 1,
-            "metadata": self.metadata,
-            "events": events,
-        }
-        pack = msgpack.packb(payload)
+        # Events are packed one by one so that we can split them into several requests if the payload would exceed
+        # the maximum size accepted by the intake.
+        batch: t.List[bytes] = []
+        batch_size = 0
+
+        for event in events:
+            packed_event = self.packer.pack(event)
+            if batch and batch_size + len(packed_event) > self.max_payload_bytes:
+                self._send_packed_events(batch)
+                batch = []
+                batch_size = 0
+
+            batch.append(packed_event)
+            batch_size += len(packed_event)
+
+        if batch:
+            self._send_packed_events(batch)
+
+    def _send_packed_events(self, packed_events: t.List[bytes]) -> None:
+        """
+        Send a payload with the given pre-packed events.
+
+        The payload is equivalent to `msgpack.packb({"version": 1, "metadata": ..., "events": [...]})`, but assembled
+        from the already packed events instead of packing them again.
+        """
+        pack = b"".join([self._get_payload_header(), self.packer.pack_array_header(len(packed_events)), *packed_events])
         response, response_data = self.connector.request(
             "POST", "/api/v2/citestcycle", data=pack, headers={"Content-Type": "application/msgpack"}, send_gzip=True
         )
@@ -152,7 +241,7 @@ class TestCoverageWriter(BaseWriter):
             span_id=test_run.span_id,
             files=files,
         )
-        self.put_event(event)
+        self.put_event(event, size=sum(len(file["bitmap"]) for file in files))
 
     def _send_events(self, events: t.List[Event]) -> None:
         files = [
@@ -160,7 +249,7 @@ class TestCoverageWriter(BaseWriter):
                 name="coverage1",
                 filename="coverage1.msgpack",
                 content_type="application/msgpack",
-                data=msgpack.packb({"version": 2, "coverages": events}),
+                data=self.packer.pack({"version": 2, "coverages": events}),
             ),
             FileAttachment(
                 name="event",
@@ -174,6 +263,11 @@ class TestCoverageWriter(BaseWriter):
 
 
 def serialize_test_run(test_run: TestRun) -> Event:
+    # This runs for every test run, so look up the parent items and the status only once.
+    suite = test_run.suite
+    module = test_run.module
+    status = test_run.get_status()
+
     return Event(
         version=2,
         type="test",
@@ -184,18 +278,18 @@ def serialize_test_run(test_run: TestRun) -> Event:
             "service": test_run.service,
             "resource": test_run.name,
             "name": "pytest.test",
-            "error": 1 if test_run.get_status() == TestStatus.FAIL else 0,
+            "error": _STATUS_TO_ERROR[status],
             "start": test_run.start_ns,
             "duration": test_run.duration_ns,
             "meta": {
                 **test_run.test.tags,
                 **test_run.tags,
                 "span.kind": "test",
-                "test.module": test_run.module.name,
-                "test.module_path": test_run.module.module_path,
+                "test.module": module.name,
+                "test.module_path": module.module_path,
                 "test.name": test_run.name,
-                "test.status": test_run.get_status().value,
-                "test.suite": test_run.suite.name,
+                "test.status": _STATUS_TO_STR[status],
+                "test.suite": suite.name,
                 "test.type": "test",
                 "type": "test",
             },
@@ -208,8 +302,8 @@ def serialize_test_run(test_run: TestRun) -> Event:
             },
             "type": "test",
             "test_session_id": test_run.session.item_id,
-            "test_module_id": test_run.module.item_id,
-            "test_suite_id": test_run.suite.item_id,
+            "test_module_id": module.item_id,
+            "test_suite_id": suite.item_id,
         },
     )
 
@@ -229,7 +323,7 @@ def serialize_suite(suite: TestSuite) -> Event:
                 **suite.tags,
                 "span.kind": "test",
                 "test.suite": suite.name,
-                "test.status": suite.get_status().value,
+                "test.status": _STATUS_TO_STR[suite.get_status()],
                 "type": "test_suite_end",
             },
             "metrics": {
@@ -262,7 +356,7 @@ def serialize_module(module: TestModule) -> Event:
                 "span.kind": "test",
                 "test.module": module.name,
                 "test.module_path": module.module_path,
-                "test.status": module.get_status().value,
+                "test.status": _STATUS_TO_STR[module.get_status()],
                 "type": "test_module_end",
             },
             "metrics": {
@@ -292,7 +386,7 @@ def serialize_session(session: TestSession) -> Event:
             "meta": {
                 **session.tags,
                 "span.kind": "test",
-                "test.status": session.get_status().value,
+                "test.status": _STATUS_TO_STR[session.get_status()],
                 "type": "test_session_end",
             },
             "metrics": {
@@ -306,3 +400,13 @@ def serialize_session(session: TestSession) -> Event:
             "test_session_id": session.item_id,
         },
     )
+
+
+SERIALIZERS: t.Mapping[t.Type[TestItem[t.Any, t.Any]], EventSerializer[t.Any]] = MappingProxyType(
+    {
+        TestRun: serialize_test_run,
+        TestSuite: serialize_suite,
+        TestModule: serialize_module,
+        TestSession: serialize_session,
+    }
+)
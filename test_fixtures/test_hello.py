@@ -50,7 +50,6 @@ def test_skip():
 
 
 def test_skip4():
-    time.sleep(DELAY)
     pytest.skip()
 
 
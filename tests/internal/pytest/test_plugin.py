@@ -148,6 +148,34 @@ class TestSkippingAndITRFeatures:
         assert call_args[0][0].mark.name == "skip"
         assert call_args[0][0].mark.kwargs["reason"] == SKIPPED_BY_ITR_REASON
 
+    def test_non_skippable_test_not_skipped(self) -> None:
+        """Test that a test that is not in the skippable items does not get skipped."""
+        test_ref = TestDataFactory.create_test_ref("test_module", "test_suite.py", "test_function")
+        other_test_ref = TestDataFactory.create_test_ref("test_module", "other_suite.py", "test_function")
+
+        mock_manager = (
+            session_manager_mock().with_skipping_enabled(True).with_skippable_items({other_test_ref}).build_mock()
+        )
+        plugin = TestOptPlugin(session_manager=mock_manager)
+
+        test = mock_test(test_ref)
+        mock_manager.discover_test.return_value = (test.module, test.suite, test)
+
+        mock_item = pytest_item_mock("test_module/test_suite.py::test_function").build()
+
+        with patch("ddtestpy.internal.pytest.plugin.trace_context"), patch(
+            "ddtestpy.internal.pytest.plugin.coverage_collection"
+        ):
+            list(plugin.pytest_runtest_protocol_wrapper(mock_item, None))
+
+        itr_skip_calls = [
+            call
+            for call in mock_item.add_marker.call_args_list
+            if call[0][0].mark.name == "skip" and call[0][0].mark.kwargs.get("reason") == SKIPPED_BY_ITR_REASON
+        ]
+        assert itr_skip_calls == []
+        assert not test.is_skipped_by_itr()
+
     def test_disabled_test_management_features(self) -> None:
         """Test test management features like disabled and quarantined tests."""
         # Create test references using TestDataFactory
@@ -203,6 +231,18 @@ class TestSessionManagement:
         assert isinstance(plugin.reports_by_nodeid, dict)
         assert isinstance(plugin.excinfo_by_report, dict)
         assert isinstance(plugin.tests_by_nodeid, dict)
+        assert plugin.test_refs_by_nodeid == {}
+
+    def test_get_test_ref_reuses_parsed_refs(self) -> None:
+        """Test that each nodeid is parsed only once and the same TestRef object is returned afterwards."""
+        mock_manager = session_manager_mock().build_mock()
+        plugin = TestOptPlugin(session_manager=mock_manager)
+
+        test_ref = plugin._get_test_ref("tests/test_example.py::test_function")
+
+        assert test_ref == nodeid_to_test_ref("tests/test_example.py::test_function")
+        assert plugin._get_test_ref("tests/test_example.py::test_function") is test_ref
+        assert plugin._get_test_ref("tests/test_example.py::test_other") is not test_ref
 
     def test_xdist_plugin_initialization(self) -> None:
         """Test that XdistTestOptPlugin initializes correctly."""
@@ -346,6 +386,15 @@ class TestNodeIdToTestRef:
         assert result.suite.name == "test_example.py"
         assert result.name == "test_function"
 
+    def test_nodeid_with_separators_in_parameters(self) -> None:
+        """Test that `/` and `::` in test parameters do not affect the module and suite names."""
+        nodeid = "tests/test_example.py::test_function[a/b::c]"
+        result = nodeid_to_test_ref(nodeid)
+
+        assert result.suite.module.name == "tests"
+        assert result.suite.name == "test_example.py"
+        assert result.name == "test_function[a/b::c]"
+
     def test_nodeid_fallback_format(self) -> None:
         """Test parsing a nodeid that doesn't match the expected format."""
         nodeid = "some_weird_format"
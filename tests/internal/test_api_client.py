@@ -0,0 +1,87 @@
+"""Tests for ddtestpy.internal.api_client module."""
+
+import typing as t
+from unittest.mock import Mock
+
+from ddtestpy.internal.api_client import APIClient
+from ddtestpy.internal.git import GitTag
+from ddtestpy.internal.test_data import ITRSkippingLevel
+from ddtestpy.internal.test_data import ModuleRef
+from ddtestpy.internal.test_data import SuiteRef
+from ddtestpy.internal.test_data import TestRef
+
+
+def _make_api_client(itr_skipping_level: ITRSkippingLevel, response_data: t.Dict[str, t.Any]) -> APIClient:
+    mock_connector = Mock()
+    mock_connector.post_json.return_value = (Mock(status=200), response_data)
+    mock_connector_setup = Mock()
+    mock_connector_setup.get_connector_for_subdomain.return_value = mock_connector
+
+    return APIClient(
+        service="some-service",
+        env="some-env",
+        env_tags={GitTag.REPOSITORY_URL: "https://github.com/some/repo", GitTag.COMMIT_SHA: "abcd1234"},
+        itr_skipping_level=itr_skipping_level,
+        configurations={},
+        connector_setup=mock_connector_setup,
+    )
+
+
+def _skippable_item(item_type: str, suite: str, name: t.Optional[str] = None) -> t.Dict[str, t.Any]:
+    attributes = {"suite": suite, "configurations": {"test.bundle": "some_module"}}
+    if name is not None:
+        attributes["name"] = name
+    return {"type": item_type, "attributes": attributes}
+
+
+class TestGetSkippableTests:
+    """Tests for APIClient.get_skippable_tests."""
+
+    def test_test_level(self) -> None:
+        """Test that tests are returned at test level, sharing module and suite refs between tests."""
+        response_data = {
+            "data": [
+                _skippable_item("test", "test_a.py", "test_1"),
+                _skippable_item("test", "test_a.py", "test_2"),
+                _skippable_item("test", "test_b.py", "test_1"),
+                _skippable_item("suite", "test_c.py"),
+            ],
+            "meta": {"correlation_id": "some-correlation-id"},
+        }
+        api_client = _make_api_client(ITRSkippingLevel.TEST, response_data)
+
+        skippable_items, correlation_id = api_client.get_skippable_tests()
+
+        module_ref = ModuleRef("some_module")
+        assert skippable_items == {
+            TestRef(SuiteRef(module_ref, "test_a.py"), "test_1"),
+            TestRef(SuiteRef(module_ref, "test_a.py"), "test_2"),
+            TestRef(SuiteRef(module_ref, "test_b.py"), "test_1"),
+        }
+        assert correlation_id == "some-correlation-id"
+
+        suite_refs = {id(t.cast(TestRef, item).suite) for item in skippable_items}
+        assert len(suite_refs) == 2
+        module_refs = {id(t.cast(TestRef, item).suite.module) for item in skippable_items}
+        assert len(module_refs) == 1
+
+    def test_suite_level(self) -> None:
+        """Test that only suites are returned at suite level."""
+        response_data = {
+            "data": [
+                _skippable_item("test", "test_a.py", "test_1"),
+                _skippable_item("suite", "test_c.py"),
+            ],
+            "meta": {"correlation_id": "some-correlation-id"},
+        }
+        api_client = _make_api_client(ITRSkippingLevel.SUITE, response_data)
+
+        skippable_items, correlation_id = api_client.get_skippable_tests()
+
+        assert skippable_items == {SuiteRef(ModuleRef("some_module"), "test_c.py")}
+
+    def test_error(self) -> None:
+        """Test that an empty set is returned if the response cannot be parsed."""
+        api_client = _make_api_client(ITRSkippingLevel.TEST, {})
+
+        assert api_client.get_skippable_tests() == (set(), None)
@@ -1,5 +1,6 @@
 """Tests for ddtestpy.internal.http module."""
 
+import gzip
 import http.client
 import os
 from unittest.mock import Mock
@@ -15,6 +16,7 @@ from ddtestpy.internal.http import BackendConnectorEVPProxySetup
 from ddtestpy.internal.http import BackendConnectorSetup
 from ddtestpy.internal.http import FileAttachment
 from ddtestpy.internal.http import UnixDomainSocketHTTPConnection
+from ddtestpy.internal.http import gzip_compress
 from tests.mocks import mock_backend_connector
 
 
@@ -91,6 +93,34 @@ class TestBackendConnector:
         assert b"content2" in body
         assert body.count(b"--boundary123") == 3  # 2 file separators + 1 end
 
+    @patch("http.client.HTTPSConnection")
+    def test_request_send_gzip(self, mock_https_connection: Mock) -> None:
+        """Test that request bodies are gzip-compressed when requested and supported by the connector."""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.read.return_value = b"ok"
+
+        mock_conn = Mock()
+        mock_conn.getresponse.return_value = mock_response
+        mock_https_connection.return_value = mock_conn
+
+        connector = BackendConnector(url="https://api.example.com", use_gzip=True)
+        connector.request("POST", "/endpoint", data=b"some data" * 100, send_gzip=True)
+
+        call_args = mock_conn.request.call_args
+        assert call_args[1]["headers"]["Content-Encoding"] == "gzip"
+        assert gzip.decompress(call_args[1]["body"]) == b"some data" * 100
+
+    def test_gzip_compress(self) -> None:
+        """Test that gzip_compress produces a valid gzip stream."""
+        data = b"hello world" * 1000
+        compressed = gzip_compress(data)
+
+        assert compressed[:2] == b"\x1f\x8b"  # gzip magic number
+        assert len(compressed) < len(data)
+        assert gzip.decompress(compressed) == data
+        assert gzip.decompress(gzip_compress(b"")) == b""
+
 
 class TestBackendConnectorSetup:
     def test_detect_agentless_setup_ok(self, monkeypatch: pytest.MonkeyPatch) -> None:
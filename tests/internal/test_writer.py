@@ -1,14 +1,20 @@
 """Tests for ddtestpy.internal.writer module."""
 
+import threading
+from unittest.mock import ANY
 from unittest.mock import Mock
 from unittest.mock import patch
 
+import msgpack  # type: ignore
+import pytest
+
 from ddtestpy.internal.http import BackendConnectorAgentlessSetup
 from ddtestpy.internal.test_data import TestModule
 from ddtestpy.internal.test_data import TestRun
 from ddtestpy.internal.test_data import TestSession
 from ddtestpy.internal.test_data import TestStatus
 from ddtestpy.internal.test_data import TestSuite
+from ddtestpy.internal.writer import SERIALIZERS
 from ddtestpy.internal.writer import Event
 from ddtestpy.internal.writer import TestCoverageWriter
 from ddtestpy.internal.writer import TestOptWriter
@@ -39,6 +45,129 @@ class TestEvent:
         assert event["test"] == "data"
         assert len(event) == 1
 
+    def test_event_has_no_instance_dict(self) -> None:
+        """Test that Event does not allocate a per-instance __dict__."""
+        event = Event()
+        assert not hasattr(event, "__dict__")
+
+        with pytest.raises(AttributeError):
+            event.some_attribute = "value"  # type: ignore[attr-defined]
+
+
+class TestBaseWriter:
+    """Tests for BaseWriter event buffering."""
+
+    @patch("ddtestpy.internal.http.BackendConnector")
+    def test_put_and_pop_events(self, mock_backend_connector: Mock) -> None:
+        """Test that pop_events returns buffered events in order and empties the buffer."""
+        writer = TestCoverageWriter(BackendConnectorAgentlessSetup(site="test", api_key="key"))
+        events = [Event(n=i) for i in range(3)]
+
+        for event in events:
+            writer.put_event(event)
+
+        assert writer.pop_events() == events
+        assert writer.pop_events() == []
+
+    @patch("ddtestpy.internal.http.BackendConnector")
+    def test_thread_safety_put_pop(self, mock_backend_connector: Mock) -> None:
+        """Test that no events are lost when producers and a consumer run concurrently."""
+        writer = TestCoverageWriter(BackendConnectorAgentlessSetup(site="test", api_key="key"))
+        popped: list[Event] = []
+
+        def produce(thread_id: int) -> None:
+            for i in range(100):
+                writer.put_event(Event(thread_id=thread_id, n=i))
+
+        threads = [threading.Thread(target=produce, args=(thread_id,)) for thread_id in range(3)]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            popped.extend(writer.pop_events())
+        for thread in threads:
+            thread.join()
+        popped.extend(writer.pop_events())
+
+        assert len(popped) == 300
+        for thread_id in range(3):
+            assert [event["n"] for event in popped if event["thread_id"] == thread_id] == list(range(100))
+
+    @patch("ddtestpy.internal.http.BackendConnector")
+    def test_concurrent_pop_events(self, mock_backend_connector: Mock) -> None:
+        """Test that concurrent consumers never return the same event twice nor lose events."""
+        writer = TestCoverageWriter(BackendConnectorAgentlessSetup(site="test", api_key="key"))
+        for i in range(10_000):
+            writer.put_event(Event(n=i))
+        results: list[list[Event]] = [[], []]
+
+        def consume(consumer_id: int) -> None:
+            while writer.events:
+                results[consumer_id].extend(writer.pop_events())
+
+        consumers = [threading.Thread(target=consume, args=(consumer_id,)) for consumer_id in range(2)]
+        for consumer in consumers:
+            consumer.start()
+        for consumer in consumers:
+            consumer.join()
+
+        assert sorted(event["n"] for result in results for event in result) == list(range(10_000))
+
+    @patch("ddtestpy.internal.http.BackendConnector")
+    def test_put_event_triggers_flush_on_event_count(self, mock_backend_connector: Mock) -> None:
+        """Test that reaching the event count threshold wakes up the background task."""
+        writer = TestCoverageWriter(BackendConnectorAgentlessSetup(site="test", api_key="key"))
+        writer.flush_num_events = 2
+
+        writer.put_event(Event())
+        assert not writer.flush_now.is_set()
+
+        writer.put_event(Event())
+        assert writer.flush_now.is_set()
+
+    @patch("ddtestpy.internal.http.BackendConnector")
+    def test_put_event_triggers_flush_on_size(self, mock_backend_connector: Mock) -> None:
+        """Test that reaching the size threshold wakes up the background task, and popping resets the size."""
+        writer = TestCoverageWriter(BackendConnectorAgentlessSetup(site="test", api_key="key"))
+        writer.flush_num_bytes = 100
+
+        writer.put_event(Event(), size=60)
+        assert not writer.flush_now.is_set()
+
+        writer.put_event(Event(), size=60)
+        assert writer.flush_now.is_set()
+
+        writer.pop_events()
+        assert writer.pending_bytes == 0
+
+    @patch("ddtestpy.internal.http.BackendConnector")
+    def test_periodic_task_flushes_early(self, mock_backend_connector: Mock) -> None:
+        """Test that the background task flushes before the periodic interval when the threshold is reached."""
+        writer = TestCoverageWriter(BackendConnectorAgentlessSetup(site="test", api_key="key"))
+        writer.flush_num_events = 1
+        sent = threading.Event()
+
+        with patch.object(writer, "_send_events", side_effect=lambda events: sent.set()) as send_events_mock:
+            writer.start()
+            writer.put_event(Event())
+            assert sent.wait(timeout=5)
+            writer.finish()
+
+        send_events_mock.assert_called_once_with([Event()])
+
+    @patch("ddtestpy.internal.http.BackendConnector")
+    def test_finish_flushes_pending_events(self, mock_backend_connector: Mock) -> None:
+        """Test that finish() wakes up the background task, flushes pending events, and stops the task."""
+        writer = TestCoverageWriter(BackendConnectorAgentlessSetup(site="test", api_key="key"))
+
+        with patch.object(writer, "_send_events") as send_events_mock:
+            writer.start()
+            writer.put_event(Event(a=1))
+            writer.finish()
+
+        assert writer.should_finish is True
+        assert not writer.task.is_alive()
+        send_events_mock.assert_called_once_with([Event(a=1)])
+
 
 class TestTestOptWriter:
     """Tests for TestOptWriter class."""
@@ -66,39 +195,107 @@ class TestTestOptWriter:
         assert TestSuite in writer.serializers
         assert TestModule in writer.serializers
         assert TestSession in writer.serializers
+        assert writer.serializers is SERIALIZERS
 
     @patch("ddtestpy.internal.http.BackendConnector")
-    @patch("msgpack.packb")
-    def test_send_events(self, mock_packb: Mock, mock_backend_connector: Mock) -> None:
+    def test_send_events(self, mock_backend_connector: Mock) -> None:
         """Test sending events to backend."""
         mock_connector = Mock()
         mock_backend_connector.return_value = mock_connector
         # Make sure request returns a tuple like the real implementation
         mock_connector.request.return_value = (Mock(), {})
-        mock_packb.return_value = b"packed_data"
 
         writer = TestOptWriter(BackendConnectorAgentlessSetup(site="test", api_key="key"))
         events = [Event(type="test1"), Event(type="test2")]
 
         writer._send_events(events)
 
-        # Check msgpack packaging
-        expected_payload = {
-            "version": 1,
-            "metadata": writer.metadata,
-            "events": events,
-        }
-        mock_packb.assert_called_once_with(expected_payload)
-
         # Check HTTP request
         mock_connector.request.assert_called_once_with(
             "POST",
             "/api/v2/citestcycle",
-            data=b"packed_data",
+            data=ANY,
             headers={"Content-Type": "application/msgpack"},
             send_gzip=True,
         )
 
+        # Check msgpack packaging
+        expected_payload = {
+            "version": 1,
+            "metadata": writer.metadata,
+            "events": events,
+        }
+        data = mock_connector.request.call_args[1]["data"]
+        assert data == msgpack.packb(expected_payload)
+
+    @patch("ddtestpy.internal.http.BackendConnector")
+    def test_send_events_splits_large_payloads(self, mock_backend_connector: Mock) -> None:
+        """Test that events are split into several requests when the payload exceeds the maximum size."""
+        mock_connector = Mock()
+        mock_backend_connector.return_value = mock_connector
+        mock_connector.request.return_value = (Mock(), {})
+
+        writer = TestOptWriter(BackendConnectorAgentlessSetup(site="test", api_key="key"))
+        events = [Event(type="test", content="x" * 100) for _ in range(5)]
+        writer.max_payload_bytes = len(msgpack.packb(events[0])) * 2
+
+        writer._send_events(events)
+
+        payloads = [msgpack.unpackb(call[1]["data"]) for call in mock_connector.request.call_args_list]
+        assert [len(payload["events"]) for payload in payloads] == [2, 2, 1]
+        assert [event for payload in payloads for event in payload["events"]] == events
+        assert all(payload["metadata"] == writer.metadata for payload in payloads)
+
+    @patch("ddtestpy.internal.http.BackendConnector")
+    def test_add_metadata_invalidates_payload_header(self, mock_backend_connector: Mock) -> None:
+        """Test that metadata added after a flush is included in subsequent payloads."""
+        mock_connector = Mock()
+        mock_backend_connector.return_value = mock_connector
+        mock_connector.request.return_value = (Mock(), {})
+
+        writer = TestOptWriter(BackendConnectorAgentlessSetup(site="test", api_key="key"))
+
+        writer._send_events([Event(type="test1")])
+        writer.add_metadata("*", {"custom.key": "custom_value"})
+        writer._send_events([Event(type="test2")])
+
+        payloads = [msgpack.unpackb(call[1]["data"]) for call in mock_connector.request.call_args_list]
+        assert "custom.key" not in payloads[0]["metadata"]["*"]
+        assert payloads[1]["metadata"]["*"]["custom.key"] == "custom_value"
+
+    @patch("ddtestpy.internal.http.BackendConnector")
+    def test_send_events_reuses_packer(self, mock_backend_connector: Mock) -> None:
+        """Test that consecutive flushes reuse the writer's packer and produce independent payloads."""
+        mock_connector = Mock()
+        mock_backend_connector.return_value = mock_connector
+        mock_connector.request.return_value = (Mock(), {})
+
+        writer = TestOptWriter(BackendConnectorAgentlessSetup(site="test", api_key="key"))
+        packer = writer.packer
+
+        writer._send_events([Event(type="test1")])
+        writer._send_events([Event(type="test2")])
+
+        assert writer.packer is packer
+        payloads = [msgpack.unpackb(call[1]["data"]) for call in mock_connector.request.call_args_list]
+        assert [payload["events"] for payload in payloads] == [[{"type": "test1"}], [{"type": "test2"}]]
+
+    @patch("ddtestpy.internal.http.BackendConnector")
+    def test_send_single_event(self, mock_backend_connector: Mock) -> None:
+        """Test that a single event is sent as the cached payload header followed by the packed event."""
+        mock_connector = Mock()
+        mock_backend_connector.return_value = mock_connector
+        mock_connector.request.return_value = (Mock(), {})
+
+        writer = TestOptWriter(BackendConnectorAgentlessSetup(site="test", api_key="key"))
+        event = Event(type="test", content={"name": "test_foo"})
+
+        writer._send_events([event])
+
+        data = mock_connector.request.call_args[1]["data"]
+        assert data == writer._get_payload_header() + b"\x91" + msgpack.packb(event)
+        assert data == msgpack.packb({"version": 1, "metadata": writer.metadata, "events": [event]})
+
 
 class TestTestCoverageWriter:
     """Tests for TestCoverageWriter class."""
@@ -145,23 +342,18 @@ class TestTestCoverageWriter:
         assert len(event["files"]) == 2
 
     @patch("ddtestpy.internal.http.BackendConnector")
-    @patch("msgpack.packb")
-    def test_send_coverage_events(self, mock_packb: Mock, mock_backend_connector: Mock) -> None:
+    def test_send_coverage_events(self, mock_backend_connector: Mock) -> None:
         """Test sending coverage events."""
         mock_connector = Mock()
         mock_backend_connector.return_value = mock_connector
         # Make sure post_files returns a tuple like the real implementation
         mock_connector.post_files.return_value = (Mock(), {})
-        mock_packb.return_value = b"packed_coverage_data"
 
         writer = TestCoverageWriter(BackendConnectorAgentlessSetup(site="test", api_key="key"))
         events = [Event(type="coverage1"), Event(type="coverage2")]
 
         writer._send_events(events)
 
-        # Check msgpack packaging
-        mock_packb.assert_called_once_with({"version": 2, "coverages": events})
-
         # Check file attachment structure
         mock_connector.post_files.assert_called_once()
         call_args = mock_connector.post_files.call_args
@@ -171,6 +363,7 @@ class TestTestCoverageWriter:
         assert len(files) == 2
         assert files[0].name == "coverage1"
         assert files[0].content_type == "application/msgpack"
+        assert files[0].data == msgpack.packb({"version": 2, "coverages": events})
         assert files[1].name == "event"
         assert files[1].content_type == "application/json"
         assert call_args[1]["send_gzip"] is True
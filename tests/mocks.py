@@ -11,8 +11,12 @@ for testing the ddtestpy framework. The design emphasizes:
 from __future__ import annotations
 
 import contextlib
+import dataclasses
+import functools
 import os
 from pathlib import Path
+from types import MappingProxyType
+from types import SimpleNamespace
 import typing as t
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -40,7 +44,8 @@ def get_mock_git_instance() -> Mock:
     mock_git_instance = Mock()
     mock_git_instance.get_latest_commits.return_value = []
     mock_git_instance.get_filtered_revisions.return_value = []
-    mock_git_instance.pack_objects.return_value = iter([])
+    # `pack_objects()` returns an iterator; build a new one on each call so it is not exhausted after the first one.
+    mock_git_instance.pack_objects.side_effect = lambda *args, **kwargs: iter([])
     return mock_git_instance
 
 
@@ -88,22 +93,32 @@ class MockDefaults:
         return session
 
 
+# Shared defaults for the builders. Nothing mutates them (builders swap in modified copies with `dataclasses.replace()`
+# instead), so they are only built once.
+_DEFAULT_SETTINGS = MockDefaults.settings()
+_DEFAULT_TEST_ENVIRONMENT: t.Mapping[str, str] = MappingProxyType(MockDefaults.test_environment())
+
+
 # =============================================================================
 # MOCK BUILDERS
 # =============================================================================
 
 
+def _never_skippable(test_ref: TestRef) -> bool:
+    return False
+
+
 class SessionManagerMockBuilder:
     """Builder for creating SessionManager mocks with flexible configuration."""
 
+    __slots__ = ("_settings", "_skippable_items", "_test_properties", "_known_tests", "_workspace_path", "_env_tags")
+
     def __init__(self) -> None:
-        self._settings = MockDefaults.settings()
+        self._settings = _DEFAULT_SETTINGS
         self._skippable_items: t.Set[t.Union[TestRef, SuiteRef]] = set()
         self._test_properties: t.Dict[TestRef, TestProperties] = {}
         self._known_tests: t.Set[TestRef] = set()
-        self._known_commits: t.List[str] = []
         self._workspace_path = "/fake/workspace"
-        self._retry_handlers: t.List[Mock] = []
         self._env_tags: t.Dict[str, str] = {}
 
     def with_settings(self, settings: Settings) -> "SessionManagerMockBuilder":
@@ -113,16 +128,7 @@ class SessionManagerMockBuilder:
 
     def with_skipping_enabled(self, enabled: bool) -> "SessionManagerMockBuilder":
         """Enable or disable test skipping."""
-        self._settings = Settings(
-            early_flake_detection=self._settings.early_flake_detection,
-            test_management=self._settings.test_management,
-            auto_test_retries=self._settings.auto_test_retries,
-            known_tests_enabled=self._settings.known_tests_enabled,
-            coverage_enabled=enabled,
-            skipping_enabled=enabled,
-            require_git=self._settings.require_git,
-            itr_enabled=self._settings.itr_enabled,
-        )
+        self._settings = dataclasses.replace(self._settings, coverage_enabled=enabled, skipping_enabled=enabled)
         return self
 
     def with_skippable_items(self, items: t.Set[t.Union[TestRef, SuiteRef]]) -> "SessionManagerMockBuilder":
@@ -159,15 +165,30 @@ class SessionManagerMockBuilder:
         mock_manager.skippable_items = self._skippable_items
         mock_manager.test_properties = self._test_properties
         mock_manager.workspace_path = self._workspace_path
-        mock_manager.retry_handlers = self._retry_handlers
+        mock_manager.retry_handlers = []
+
+        # Same logic as `SessionManager.is_skippable_test()`, but evaluated against a snapshot of the settings and
+        # skippable items taken here: changing `mock_manager.settings` or `mock_manager.skippable_items` after
+        # `build_mock()` does not affect the predicate. Configure them through the builder instead. Most tests have no
+        # skippable items at all, so those get a predicate that does no lookups.
+        if self._settings.skipping_enabled and self._skippable_items:
+            # Split the items by kind once, so each lookup only probes the set that can actually match.
+            skippable_tests = frozenset(item for item in self._skippable_items if isinstance(item, TestRef))
+            skippable_suites = frozenset(item for item in self._skippable_items if isinstance(item, SuiteRef))
+            mock_manager.is_skippable_test = (
+                lambda test_ref: test_ref in skippable_tests or test_ref.suite in skippable_suites
+            )
+        else:
+            mock_manager.is_skippable_test = _never_skippable
 
         mock_manager.session = Mock()
-        mock_manager.writer = Mock()
-        mock_manager.coverage_writer = Mock()
+        # Nothing asserts on the writers, so use stubs rather than Mocks that would record every item put into them.
+        mock_manager.writer = WriterStub()
+        mock_manager.coverage_writer = WriterStub()
 
         return mock_manager
 
-    def build_real_with_mocks(self, test_env: t.Optional[t.Dict[str, str]] = None) -> SessionManager:
+    def build_real_with_mocks(self, test_env: t.Optional[t.Mapping[str, str]] = None) -> SessionManager:
         """Build a real SessionManager with mocked dependencies.
 
         NOTE: This creates the SessionManager with mocked dependencies during initialization.
@@ -175,36 +196,45 @@ class SessionManagerMockBuilder:
         make further API calls after __init__.
         """
         if test_env is None:
-            test_env = MockDefaults.test_environment()
-
-        with patch("ddtestpy.internal.session_manager.APIClient") as mock_api_client:
-            # Configure API client mock
-            mock_client = Mock()
-            mock_client.get_settings.return_value = self._settings
-            mock_client.get_known_tests.return_value = self._known_tests
-            mock_client.get_test_management_properties.return_value = self._test_properties
-            mock_client.get_known_commits.return_value = self._known_commits
-            mock_client.send_git_pack_file.return_value = None
-            mock_client.get_skippable_tests.return_value = (self._skippable_items, None)
-            mock_api_client.return_value = mock_client
+            test_env = _DEFAULT_TEST_ENVIRONMENT
 
-            with patch("ddtestpy.internal.session_manager.get_env_tags", return_value=self._env_tags), patch(
-                "ddtestpy.internal.session_manager.get_platform_tags", return_value={}
-            ), patch("ddtestpy.internal.session_manager.Git", return_value=get_mock_git_instance()), patch.dict(
-                os.environ, test_env
-            ):
+        # Configure API client mock
+        mock_client = Mock()
+        mock_client.get_settings.return_value = self._settings
+        mock_client.get_known_tests.return_value = self._known_tests
+        mock_client.get_test_management_properties.return_value = self._test_properties
+        mock_client.get_known_commits.return_value = []
+        mock_client.send_git_pack_file.return_value = None
+        mock_client.get_skippable_tests.return_value = (self._skippable_items, None)
 
-                # Create session manager
-                test_session = MockDefaults.test_session()
-                session_manager = SessionManager(session=test_session)
-                session_manager.skippable_items = self._skippable_items
+        with patch.multiple(
+            "ddtestpy.internal.session_manager",
+            APIClient=Mock(return_value=mock_client),
+            get_env_tags=Mock(return_value=self._env_tags),
+            get_platform_tags=Mock(return_value={}),
+            Git=Mock(return_value=get_mock_git_instance()),
+        ), patch.dict(os.environ, test_env):
+            # Create session manager
+            test_session = MockDefaults.test_session()
+            session_manager = SessionManager(session=test_session)
+            session_manager.skippable_items = self._skippable_items
 
-                return session_manager
+            return session_manager
 
 
 class TestMockBuilder:
     """Builder for creating Test mocks with flexible configuration."""
 
+    __slots__ = (
+        "_test_ref",
+        "_is_attempt_to_fix",
+        "_is_disabled",
+        "_is_quarantined",
+        "_test_runs",
+        "_start_ns",
+        "_last_test_run",
+    )
+
     def __init__(self, test_ref: TestRef):
         self._test_ref = test_ref
         self._is_attempt_to_fix = False
@@ -247,15 +277,21 @@ class TestMockBuilder:
         return mock_test
 
 
+_DEFAULT_ITEM_LOCATION = ("/fake/path.py", 10, "test_name")
+_DEFAULT_ITEM_LOCATION_PARENT = Path(_DEFAULT_ITEM_LOCATION[0]).parent
+
+
 class PytestItemMockBuilder:
     """Builder for creating pytest.Item mocks with flexible configuration."""
 
+    __slots__ = ("_nodeid", "_user_properties", "_keywords", "_location", "_location_parent", "_additional_attrs")
+
     def __init__(self, nodeid: str):
         self._nodeid = nodeid
         self._user_properties: t.List[t.Tuple[str, t.Any]] = []
         self._keywords: t.Dict[str, t.Any] = {}
-        self._path = Mock()
-        self._location = ("/fake/path.py", 10, "test_name")
+        self._location = _DEFAULT_ITEM_LOCATION
+        self._location_parent = _DEFAULT_ITEM_LOCATION_PARENT
         self._additional_attrs: t.Dict[str, t.Any] = {}
 
     def with_user_properties(self, properties: t.List[t.Tuple[str, t.Any]]) -> "PytestItemMockBuilder":
@@ -271,6 +307,7 @@ class PytestItemMockBuilder:
     def with_location(self, path: str, lineno: int, testname: str) -> "PytestItemMockBuilder":
         """Set test location info."""
         self._location = (path, lineno, testname)
+        self._location_parent = Path(path).parent
         return self
 
     def with_attribute(self, name: str, value: t.Any) -> "PytestItemMockBuilder":
@@ -284,8 +321,9 @@ class PytestItemMockBuilder:
         mock_item.nodeid = self._nodeid
         mock_item.add_marker = Mock()
         mock_item.reportinfo.return_value = self._location
-        mock_item.path = self._path
-        mock_item.path.absolute.return_value.parent = Path(self._location[0]).parent
+        # The plugin only uses `item.path.absolute().parent` and `str(item.path)`, so a plain namespace is enough here.
+        absolute_path = SimpleNamespace(parent=self._location_parent)
+        mock_item.path = SimpleNamespace(absolute=lambda: absolute_path)
         mock_item.user_properties = self._user_properties
         mock_item.keywords = self._keywords
         mock_item.location = self._location
@@ -303,24 +341,29 @@ class PytestItemMockBuilder:
 
 
 class TestDataFactory:
-    """Factory for creating test data objects."""
+    """Factory for creating test data objects.
+
+    Refs are immutable, so the factories are memoized: asking for the same names again returns the same objects.
+    """
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def create_test_ref(
         module_name: str = "test_module", suite_name: str = "test_suite.py", test_name: str = "test_function"
     ) -> TestRef:
         """Create a TestRef with sensible defaults."""
-        module_ref = ModuleRef(module_name)
-        suite_ref = SuiteRef(module_ref, suite_name)
+        suite_ref = TestDataFactory.create_suite_ref(module_name, suite_name)
         return TestRef(suite_ref, test_name)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def create_suite_ref(module_name: str = "test_module", suite_name: str = "test_suite.py") -> SuiteRef:
         """Create a SuiteRef with sensible defaults."""
-        module_ref = ModuleRef(module_name)
+        module_ref = TestDataFactory.create_module_ref(module_name)
         return SuiteRef(module_ref, suite_name)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def create_module_ref(module_name: str = "test_module") -> ModuleRef:
         """Create a ModuleRef with sensible defaults."""
         return ModuleRef(module_name)
@@ -331,9 +374,60 @@ class TestDataFactory:
 # =============================================================================
 
 
+# Settings template for API client mocks: only the feature flags change between builds, so they are swapped in with
+# `dataclasses.replace()` instead of spelling out the whole structure every time.
+_API_CLIENT_BASE_SETTINGS = Settings(
+    early_flake_detection=EarlyFlakeDetectionSettings(
+        enabled=False,
+        slow_test_retries_5s=3,
+        slow_test_retries_10s=2,
+        slow_test_retries_30s=1,
+        slow_test_retries_5m=1,
+        faulty_session_threshold=30,
+    ),
+    require_git=False,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _api_client_settings(
+    efd_enabled: bool,
+    test_management_enabled: bool,
+    auto_retries_enabled: bool,
+    known_tests_enabled: bool,
+    coverage_enabled: bool,
+    skipping_enabled: bool,
+) -> Settings:
+    """Return the API client mock settings for the given feature flags.
+
+    Settings are never mutated after being returned by the API client, so builds with the same flags share one object.
+    """
+    return dataclasses.replace(
+        _API_CLIENT_BASE_SETTINGS,
+        early_flake_detection=dataclasses.replace(_API_CLIENT_BASE_SETTINGS.early_flake_detection, enabled=efd_enabled),
+        test_management=TestManagementSettings(enabled=test_management_enabled),
+        auto_test_retries=AutoTestRetriesSettings(enabled=auto_retries_enabled),
+        known_tests_enabled=known_tests_enabled,
+        coverage_enabled=coverage_enabled,
+        skipping_enabled=skipping_enabled,
+        itr_enabled=skipping_enabled,
+    )
+
+
 class APIClientMockBuilder:
     """Builder for creating APIClient mocks with comprehensive network call prevention."""
 
+    __slots__ = (
+        "_skipping_enabled",
+        "_coverage_enabled",
+        "_auto_retries_enabled",
+        "_efd_enabled",
+        "_test_management_enabled",
+        "_known_tests_enabled",
+        "_skippable_items",
+        "_known_tests",
+    )
+
     def __init__(self) -> None:
         self._skipping_enabled = False
         self._coverage_enabled = False
@@ -383,48 +477,52 @@ class APIClientMockBuilder:
         self._skippable_items = items
         return self
 
-    def build(self) -> Mock:
-        """Build the APIClient mock with comprehensive mocking."""
-        mock_client = Mock()
-
-        # Mock all API methods to prevent real HTTP calls
-        mock_client.get_settings.return_value = Settings(
-            early_flake_detection=EarlyFlakeDetectionSettings(
-                enabled=self._efd_enabled,
-                slow_test_retries_5s=3,
-                slow_test_retries_10s=2,
-                slow_test_retries_30s=1,
-                slow_test_retries_5m=1,
-                faulty_session_threshold=30,
-            ),
-            test_management=TestManagementSettings(enabled=self._test_management_enabled),
-            auto_test_retries=AutoTestRetriesSettings(enabled=self._auto_retries_enabled),
+    def _settings(self) -> Settings:
+        return _api_client_settings(
+            efd_enabled=self._efd_enabled,
+            test_management_enabled=self._test_management_enabled,
+            auto_retries_enabled=self._auto_retries_enabled,
             known_tests_enabled=self._known_tests_enabled,
             coverage_enabled=self._coverage_enabled,
             skipping_enabled=self._skipping_enabled,
-            require_git=False,
-            itr_enabled=self._skipping_enabled,
         )
 
+    def _correlation_id(self) -> t.Optional[str]:
+        return "correlation-123" if self._skippable_items else None
+
+    def build(self) -> Mock:
+        """Build the APIClient mock with comprehensive mocking."""
+        mock_client = Mock()
+
+        # Mock all API methods to prevent real HTTP calls
+        mock_client.get_settings.return_value = self._settings()
         mock_client.get_known_tests.return_value = self._known_tests
         mock_client.get_test_management_properties.return_value = {}
         mock_client.get_known_commits.return_value = []
         mock_client.send_git_pack_file.return_value = None
-        mock_client.get_skippable_tests.return_value = (
-            self._skippable_items,
-            "correlation-123" if self._skippable_items else None,
-        )
+        mock_client.get_skippable_tests.return_value = (self._skippable_items, self._correlation_id())
 
         return mock_client
 
+    def build_stub(self) -> APIClientStub:
+        """Build an APIClientStub with the same responses as `build()`, for tests that don't assert on calls."""
+        return APIClientStub(
+            settings=self._settings(),
+            known_tests=self._known_tests,
+            skippable_items=self._skippable_items,
+            correlation_id=self._correlation_id(),
+        )
+
 
 class BackendConnectorMockBuilder:
     """Builder for creating BackendConnector mocks that prevent real HTTP calls."""
 
+    __slots__ = ("_post_json_responses", "_get_json_responses", "_request_responses", "_post_files_responses")
+
     def __init__(self) -> None:
         self._post_json_responses: t.Dict[str, t.Any] = {}
         self._get_json_responses: t.Dict[str, t.Any] = {}
-        self._request_responses: t.Dict[str, t.Any] = {}
+        self._request_responses: t.Dict[t.Tuple[str, str], t.Any] = {}
         self._post_files_responses: t.Dict[str, t.Any] = {}
 
     def with_post_json_response(self, endpoint: str, response_data: t.Any) -> "BackendConnectorMockBuilder":
@@ -439,7 +537,7 @@ class BackendConnectorMockBuilder:
 
     def with_request_response(self, method: str, path: str, response_data: t.Any) -> "BackendConnectorMockBuilder":
         """Mock a specific HTTP request response."""
-        self._request_responses[f"{method}:{path}"] = response_data
+        self._request_responses[method, path] = response_data
         return self
 
     def build(self) -> Mock:
@@ -458,7 +556,7 @@ class BackendConnectorMockBuilder:
             return Mock(status=404), {}
 
         def mock_request(method: str, path: str, **kwargs: t.Any) -> t.Tuple[Mock, t.Any]:
-            key = f"{method}:{path}"
+            key = (method, path)
             if key in self._request_responses:
                 return Mock(status=200), self._request_responses[key]
             return Mock(status=404), {}
@@ -526,8 +624,8 @@ def mock_api_client_settings(
     known_tests_enabled: bool = False,
     skippable_items: t.Optional[t.Set[t.Union[TestRef, SuiteRef]]] = None,
     known_tests: t.Optional[t.Set[TestRef]] = None,
-) -> Mock:
-    """Create a comprehensive API client mock - convenience function."""
+) -> APIClientStub:
+    """Create a comprehensive API client stub - convenience function."""
     builder: "APIClientMockBuilder" = APIClientMockBuilder()
 
     if skipping_enabled:
@@ -545,7 +643,7 @@ def mock_api_client_settings(
     if skippable_items:
         builder = builder.with_skippable_items(skippable_items)
 
-    return builder.build()
+    return builder.build_stub()
 
 
 def mock_backend_connector() -> "BackendConnectorMockBuilder":
@@ -553,9 +651,106 @@ def mock_backend_connector() -> "BackendConnectorMockBuilder":
     return BackendConnectorMockBuilder()
 
 
+class APIClientStub:
+    """Lightweight stand-in for an APIClient that returns fixed responses.
+
+    Like `BackendConnectorStub`, this avoids building a `Mock` whose methods are only there to return canned values.
+    Use `APIClientMockBuilder.build()` when a test needs call assertions.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        known_tests: t.Set[TestRef],
+        skippable_items: t.Set[t.Union[TestRef, SuiteRef]],
+        correlation_id: t.Optional[str],
+    ) -> None:
+        self._settings = settings
+        self._known_tests = known_tests
+        self._skippable_items = skippable_items
+        self._correlation_id = correlation_id
+
+    def get_settings(self) -> Settings:
+        return self._settings
+
+    def get_known_tests(self) -> t.Set[TestRef]:
+        return self._known_tests
+
+    def get_test_management_properties(self) -> t.Dict[TestRef, TestProperties]:
+        return {}
+
+    def get_known_commits(self, latest_commits: t.List[str]) -> t.List[str]:
+        return []
+
+    def send_git_pack_file(self, packfile: Path) -> None:
+        pass
+
+    def get_skippable_tests(self) -> t.Tuple[t.Set[t.Union[TestRef, SuiteRef]], t.Optional[str]]:
+        return self._skippable_items, self._correlation_id
+
+    def close(self) -> None:
+        pass
+
+
+class BackendConnectorStub:
+    """Lightweight stand-in for a BackendConnector without any configured responses.
+
+    Every JSON endpoint answers 404 with an empty body and file uploads answer 200, like an unconfigured
+    `BackendConnectorMockBuilder` mock, but without the cost of building a `Mock` and recording calls. Use the builder
+    when a test needs canned responses or call assertions.
+    """
+
+    def request(self, method: str, path: str, **kwargs: t.Any) -> t.Tuple[SimpleNamespace, t.Any]:
+        return SimpleNamespace(status=404), {}
+
+    def get_json(self, path: str, **kwargs: t.Any) -> t.Tuple[SimpleNamespace, t.Any]:
+        return SimpleNamespace(status=404), {}
+
+    def post_json(self, path: str, data: t.Any, **kwargs: t.Any) -> t.Tuple[SimpleNamespace, t.Any]:
+        return SimpleNamespace(status=404), {}
+
+    def post_files(self, path: str, files: t.Any, **kwargs: t.Any) -> t.Tuple[SimpleNamespace, t.Dict[str, t.Any]]:
+        return SimpleNamespace(status=200), {}
+
+    def close(self) -> None:
+        pass
+
+
+class WriterStub:
+    """Lightweight stand-in for TestOptWriter/TestCoverageWriter that discards everything it is given.
+
+    Like `BackendConnectorStub`, this avoids building a `Mock` and recording calls when a test only needs the writers
+    to stay off the network. Use `EventCapture` when a test needs to inspect the events that were written.
+    """
+
+    def start(self) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def add_metadata(self, event_type: str, metadata: t.Dict[str, str]) -> None:
+        pass
+
+    def put_item(self, item: t.Any) -> None:
+        pass
+
+    def put_event(self, event: t.Any, size: int = 0) -> None:
+        pass
+
+    def put_coverage(self, test_run: t.Any, coverage_bitmaps: t.Any) -> None:
+        pass
+
+    def _send_events(self, events: t.Any) -> None:
+        pass
+
+
 class BackendConnectorMockSetup:
-    def get_connector_for_subdomain(self, subdomain: str) -> Mock:
-        return mock_backend_connector().build()
+    def get_connector_for_subdomain(self, subdomain: str) -> BackendConnectorStub:
+        return BackendConnectorStub()
 
 
 @contextlib.contextmanager
@@ -570,13 +765,11 @@ def setup_standard_mocks() -> t.Generator[None, None, None]:
         yield
 
 
-def network_mocks() -> t.ContextManager[t.Any]:
+@contextlib.contextmanager
+def network_mocks() -> t.Generator[None, None, None]:
     """Create comprehensive mocks that prevent ALL network calls at multiple levels."""
-    from contextlib import ExitStack
-
-    def _create_stack() -> t.ContextManager[t.Any]:
-        stack = ExitStack()
-
+    # Patches are entered inside the `with` block, so the ones already applied are undone if a later one fails.
+    with contextlib.ExitStack() as stack:
         # Mock the session manager dependencies
         stack.enter_context(
             patch.multiple(
@@ -599,15 +792,16 @@ def network_mocks() -> t.ContextManager[t.Any]:
         stack.enter_context(patch("ddtestpy.internal.session_manager.APIClient"))
 
         # Mock the writer to prevent any HTTP calls from the writer
-        mock_writer = Mock()
-        mock_writer.flush.return_value = None
-        mock_writer._send_events.return_value = None
-        stack.enter_context(patch("ddtestpy.internal.writer.TestOptWriter", return_value=mock_writer))
-        stack.enter_context(patch("ddtestpy.internal.writer.TestCoverageWriter", return_value=mock_writer))
-
-        return stack
+        writer_stub = WriterStub()
+        stack.enter_context(
+            patch.multiple(
+                "ddtestpy.internal.writer",
+                TestOptWriter=Mock(return_value=writer_stub),
+                TestCoverageWriter=Mock(return_value=writer_stub),
+            )
+        )
 
-    return _create_stack()
+        yield
 
 
 class EventCapture:
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import os
+import typing as t
 from unittest.mock import Mock
 from unittest.mock import patch
 
@@ -8,11 +9,14 @@ from _pytest.monkeypatch import MonkeyPatch
 from _pytest.pytester import Pytester
 import pytest
 
+from ddtestpy.internal.retry_handlers import AutoTestRetriesHandler
 from ddtestpy.internal.session_manager import SessionManager
 from ddtestpy.internal.test_data import ModuleRef
 from ddtestpy.internal.test_data import SuiteRef
+from ddtestpy.internal.test_data import Test
 from ddtestpy.internal.test_data import TestRef
 from ddtestpy.internal.test_data import TestSession
+from ddtestpy.internal.test_data import TestStatus
 from tests.mocks import mock_api_client_settings
 from tests.mocks import network_mocks
 from tests.mocks import setup_standard_mocks
@@ -25,8 +29,20 @@ class TestFeaturesWithMocking:
     """High-level feature tests using pytester with mocked dependencies."""
 
     @pytest.mark.slow
-    def test_simple_plugin_enabled(self, pytester: Pytester) -> None:
-        """Test that plugin runs when --ddtestpy is used."""
+    @pytest.mark.parametrize(
+        "plugin_args,expected_api_client_calls",
+        [
+            (["--ddtestpy"], 1),
+            (["--no-ddtestpy"], 0),
+            ([], 0),
+            (["--ddtestpy", "--no-ddtestpy"], 0),
+        ],
+        ids=["enabled", "disabled", "not_explicitly_enabled", "disabled_overrides_enabled"],
+    )
+    def test_simple_plugin_enablement(
+        self, pytester: Pytester, plugin_args: t.List[str], expected_api_client_calls: int
+    ) -> None:
+        """Test that the plugin only runs when --ddtestpy is used and --no-ddtestpy is not."""
         # Create a simple test file
         pytester.makepyfile(
             """
@@ -40,81 +56,9 @@ class TestFeaturesWithMocking:
         with network_mocks(), patch("ddtestpy.internal.session_manager.APIClient") as mock_api_client:
             mock_api_client.return_value = mock_api_client_settings()
 
-            result = pytester.runpytest("--ddtestpy", "-p", "no:ddtrace", "-v")
-
-        assert mock_api_client.call_count == 1
-
-        # Test should pass
-        assert result.ret == 0
-        result.assert_outcomes(passed=1)
-
-    @pytest.mark.slow
-    def test_simple_plugin_disabled(self, pytester: Pytester) -> None:
-        """Test that plugin does not run when --no-ddtestpy is used."""
-        # Create a simple test file
-        pytester.makepyfile(
-            """
-            def test_simple():
-                '''A simple test.'''
-                assert True
-        """
-        )
-
-        # Use network mocks to prevent all real HTTP calls
-        with network_mocks(), patch("ddtestpy.internal.session_manager.APIClient") as mock_api_client:
-            mock_api_client.return_value = mock_api_client_settings()
-
-            result = pytester.runpytest("--no-ddtestpy", "-p", "no:ddtrace", "-v")
-
-        assert mock_api_client.call_count == 0
-
-        # Test should pass
-        assert result.ret == 0
-        result.assert_outcomes(passed=1)
-
-    @pytest.mark.slow
-    def test_simple_plugin_not_explicitly_enabled(self, pytester: Pytester) -> None:
-        """Test that plugin does not run when neither --ddtestpy nor --no-ddtestpy is used."""
-        # Create a simple test file
-        pytester.makepyfile(
-            """
-            def test_simple():
-                '''A simple test.'''
-                assert True
-        """
-        )
-
-        # Use network mocks to prevent all real HTTP calls
-        with network_mocks(), patch("ddtestpy.internal.session_manager.APIClient") as mock_api_client:
-            mock_api_client.return_value = mock_api_client_settings()
+            result = pytester.runpytest(*plugin_args, "-p", "no:ddtrace", "-v")
 
-            result = pytester.runpytest("-p", "no:ddtrace", "-v")
-
-        assert mock_api_client.call_count == 0
-
-        # Test should pass
-        assert result.ret == 0
-        result.assert_outcomes(passed=1)
-
-    @pytest.mark.slow
-    def test_simple_plugin_disabled_overrides_enabled(self, pytester: Pytester) -> None:
-        """Test that plugin does not run when both --ddtestpy nor --no-ddtestpy is used."""
-        # Create a simple test file
-        pytester.makepyfile(
-            """
-            def test_simple():
-                '''A simple test.'''
-                assert True
-        """
-        )
-
-        # Use network mocks to prevent all real HTTP calls
-        with network_mocks(), patch("ddtestpy.internal.session_manager.APIClient") as mock_api_client:
-            mock_api_client.return_value = mock_api_client_settings()
-
-            result = pytester.runpytest("--ddtestpy", "--no-ddtestpy", "-p", "no:ddtrace", "-v")
-
-        assert mock_api_client.call_count == 0
+        assert mock_api_client.call_count == expected_api_client_calls
 
         # Test should pass
         assert result.ret == 0
@@ -151,22 +95,16 @@ class TestFeaturesWithMocking:
         # Check the output for retry indicators
         output = result.stdout.str()
 
-        # Look for test execution lines - should see multiple attempts for the failing test
-        assert "test_always_fails" in output
-        assert "test_passes" in output
-
         # Verify that retries happened - should see "RETRY FAILED (Auto Test Retries)" messages
         # DEV: We configured DD_CIVISIBILITY_FLAKY_RETRY_COUNT=2
         # BUT the plugin will show 3 retry attempts (as it includes the initial attempt)
         retry_messages = output.count("RETRY FAILED (Auto Test Retries)")
         assert retry_messages == 3, f"Expected 3 retry messages, got {retry_messages}"
 
-        # Should see the final summary mentioning dd_retry
-        assert "dd_retry" in output
-
-        # The test should ultimately fail after all retries
-        assert "test_always_fails FAILED" in output
-        assert "test_passes PASSED" in output
+        # The test should ultimately fail after all retries, and the final summary should mention dd_retry
+        result.stdout.fnmatch_lines(["*test_always_fails FAILED*"])
+        result.stdout.fnmatch_lines(["*test_passes PASSED*"])
+        result.stdout.fnmatch_lines(["*dd_retry*"])
 
     @pytest.mark.slow
     def test_early_flake_detection_with_pytester(self, pytester: Pytester) -> None:
@@ -216,12 +154,10 @@ class TestFeaturesWithMocking:
         )
         assert known_test_efd_retry_messages == 0, f"Expected 0 EFD retry messages, got {known_test_efd_retry_messages}"
 
-        # Should see the final summary mentioning dd_retry
-        assert "dd_retry" in output
-
-        # The new test should ultimately fail after EFD retries
-        assert "test_new_flaky FAILED" in output
-        assert "test_known_test PASSED" in output
+        # The new test should ultimately fail after EFD retries, and the final summary should mention dd_retry
+        result.stdout.fnmatch_lines(["*test_new_flaky FAILED*"])
+        result.stdout.fnmatch_lines(["*test_known_test PASSED*"])
+        result.stdout.fnmatch_lines(["*dd_retry*"])
 
     @pytest.mark.slow
     def test_intelligent_test_runner_with_pytester(self, pytester: Pytester) -> None:
@@ -257,17 +193,12 @@ class TestFeaturesWithMocking:
         # Verify outcomes: one test skipped by ITR, one test passed
         result.assert_outcomes(passed=1, skipped=1)
 
-        # Check the output for ITR skip indicators
-        output = result.stdout.str()
-
-        # Verify that ITR skipped the test with the correct reason
-        assert "SKIPPED" in output
-        # The reason might be truncated in the output, so check for the beginning of the message
-        assert "Skipped by Datadog" in output
-
         # The skippable test should be marked as skipped, the other should pass
-        assert "test_should_be_skipped SKIPPED" in output
-        assert "test_should_run PASSED" in output
+        result.stdout.fnmatch_lines(["*test_should_be_skipped SKIPPED*"])
+        result.stdout.fnmatch_lines(["*test_should_run PASSED*"])
+        # Verify that ITR skipped the test with the correct reason. The reason might be truncated in the output, so
+        # check for the beginning of the message.
+        result.stdout.fnmatch_lines(["*Skipped by Datadog*"])
 
 
 class TestPytestPluginIntegration:
@@ -352,8 +283,7 @@ class TestPytestPluginIntegration:
         result.assert_outcomes(passed=1)
 
         # Should not have any error messages about plugin loading
-        output = result.stdout.str()
-        assert "Error setting up Test Optimization plugin" not in output
+        result.stdout.no_fnmatch_line("*Error setting up Test Optimization plugin*")
 
     @pytest.mark.slow
     def test_test_session_name_extraction(self, pytester: Pytester) -> None:
@@ -443,8 +373,6 @@ class TestRetryHandler:
             session_manager.setup_retry_handlers()
 
             # Check that AutoTestRetriesHandler was added
-            from ddtestpy.internal.retry_handlers import AutoTestRetriesHandler
-
             retry_handlers = session_manager.retry_handlers
             auto_retry_handler = next((h for h in retry_handlers if isinstance(h, AutoTestRetriesHandler)), None)
 
@@ -454,13 +382,6 @@ class TestRetryHandler:
 
     def test_retry_handler_logic(self) -> None:
         """Test the retry logic of AutoTestRetriesHandler."""
-        from ddtestpy.internal.retry_handlers import AutoTestRetriesHandler
-        from ddtestpy.internal.test_data import ModuleRef
-        from ddtestpy.internal.test_data import SuiteRef
-        from ddtestpy.internal.test_data import Test
-        from ddtestpy.internal.test_data import TestRef
-        from ddtestpy.internal.test_data import TestStatus
-
         # Create a mock session manager
         mock_session_manager = Mock()
 